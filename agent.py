@@ -1,12 +1,19 @@
-
-from pathlib import Path
-
+import json
+import os
+import stat
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import httpx
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.models import get_user_agent
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 
-from skill_loader import locate_skills, get_skill_content
+from skill_loader import SkillMetadata, locate_skills, get_skill_content
 
 BASE_PROMPT = """
 You are a concise, helpful assistant with access to a set of skills. Use these rules when answering:
@@ -26,19 +33,196 @@ You are a concise, helpful assistant with access to a set of skills. Use these r
 You have the following skills available:
 """
 
+def _with_cached_system_prompt(request: httpx.Request) -> httpx.Request:
+    """
+    Return a copy of a chat completion request whose leading system message is
+    marked as an Anthropic prompt cache breakpoint.
+
+    Args:
+        request: The outgoing request
+
+    Returns:
+        The rewritten request, or the original one if it has no plain-text system message
+    """
+    try:
+        body = json.loads(request.content)
+    except (httpx.RequestNotRead, ValueError):
+        return request
+
+    messages = body.get("messages") if isinstance(body, dict) else None
+    if not messages or messages[0].get("role") != "system" or not isinstance(messages[0].get("content"), str):
+        return request
+
+    messages[0]["content"] = [
+        {"type": "text", "text": messages[0]["content"], "cache_control": {"type": "ephemeral"}},
+    ]
+    headers = [(k, v) for k, v in request.headers.raw if k.lower() != b"content-length"]
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=headers,
+        content=json.dumps(body).encode("utf-8"),
+        extensions=request.extensions,
+    )
+
+
+class PromptCachingClient(httpx.AsyncClient):
+    """
+    HTTP client that enables Anthropic prompt caching for OpenRouter chat completions.
+
+    The instructions (BASE_PROMPT plus the skills list) are identical on every turn, so
+    they are sent as a content block with cache_control, which OpenRouter forwards to
+    Anthropic. Together with the tool definitions that precede them, they are then
+    billed as cache reads instead of being prefilled again on each request.
+
+    Requests are rewritten in send() so httpx keeps its default transport, including
+    proxy settings taken from the environment.
+    """
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        if request.method == "POST" and request.url.path.endswith("/chat/completions"):
+            request = _with_cached_system_prompt(request)
+        return await super().send(request, **kwargs)
+
+
+# Number of files load_file_content keeps in memory per agent
+FILE_CACHE_SIZE = 64
+
+
+@dataclass
+class SkillState:
+    """Per-agent state passed to the skill tools as RunContext deps."""
+
+    skills_by_name: Dict[str, SkillMetadata]
+    skills_by_casefold: Dict[str, SkillMetadata]
+    available_skills: str
+    # LRU cache of file contents keyed by (absolute_path, mtime_ns, size)
+    file_cache: "OrderedDict[tuple[str, int, int], str]" = field(default_factory=OrderedDict)
+    # Sync tools run on worker threads, and the model may call them in parallel
+    file_cache_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def from_skills(cls, skills: List[SkillMetadata]) -> "SkillState":
+        """Index skills by name; the first skill with a given name wins, as with a linear scan."""
+        skills_by_name = {}
+        skills_by_casefold = {}
+        for skill in skills:
+            skills_by_name.setdefault(skill.name, skill)
+            skills_by_casefold.setdefault(skill.name.casefold().strip(), skill)
+        return cls(
+            skills_by_name=skills_by_name,
+            skills_by_casefold=skills_by_casefold,
+            available_skills=", ".join(sorted(skills_by_name)),
+        )
+
+
+def list_skill_files(ctx: RunContext[SkillState], skill_name: str) -> str:
+    """
+    List all files in the folder for the skill with the given name.
+
+    Args:
+        ctx: RunContext carrying the agent's SkillState
+        skill_name: The human-readable name field from the skill's frontmatter
+
+    Returns:
+        A newline-separated list of file paths contained in the skill's folder,
+        or a helpful message if the skill is not found or fails to load.
+    """
+    state = ctx.deps
+    # Prefer exact match on name, then fallback to case-insensitive match
+    target = state.skills_by_name.get(skill_name) or state.skills_by_casefold.get(skill_name.casefold().strip())
+
+    if target is None:
+        return f"Skill '{skill_name}' not found. Available skills: {state.available_skills}"
+
+    try:
+        content = get_skill_content(target.skill_path)
+        # Include SKILL.md explicitly along with other files discovered recursively
+        all_files = [str(target.skill_path / "SKILL.md"), *content.other_files]
+        return "\n".join(all_files)
+    except Exception as e:
+        return f"Failed to list files for '{skill_name}': {e}"
+
+
+def load_file_content(ctx: RunContext[SkillState], file_path: str) -> str:
+    """
+    Load and return the content of the file at the given path.
+
+    Args:
+        ctx: RunContext carrying the agent's SkillState
+        file_path: Absolute or relative path to a file
+
+    Returns:
+        The textual content of the file, or an error message if the file
+        doesn't exist, isn't a file, is too large, or can't be decoded.
+    """
+    # A single stat() answers existence, type and size
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
+    except (OSError, ValueError) as e:
+        # ValueError covers paths os.stat() rejects outright, e.g. with an embedded NUL
+        return f"Failed to call stat() on file '{file_path}': {e}"
+    if not stat.S_ISREG(st.st_mode):
+        return f"Path is not a file: {file_path}"
+    # Guard against accidentally loading very large files
+    if st.st_size > 5 * 1024 * 1024:  # 5 MB limit
+        return f"File is too large to display ({st.st_size} bytes): {file_path}"
+
+    # Serve repeated reads from the cache; a changed mtime or size misses it
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    state = ctx.deps
+    with state.file_cache_lock:
+        cached = state.file_cache.get(key)
+        if cached is not None:
+            state.file_cache.move_to_end(key)
+    if cached is not None:
+        return cached
+
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        return f"Failed to read file '{file_path}': {e}"
+    # Decode as UTF-8; replace undecodable bytes to avoid exceptions
+    text = data.decode("utf-8", errors="replace")
+    # Pseudo-files (e.g. under /proc) report a size of 0, and a file may change
+    # between stat() and read(); only cache reads that match what stat() reported
+    if len(data) != st.st_size:
+        return text
+    with state.file_cache_lock:
+        state.file_cache[key] = text
+        if len(state.file_cache) > FILE_CACHE_SIZE:
+            state.file_cache.popitem(last=False)
+    return text
+
+
 class ProgressiveDisclosureAgent:
     def __init__(self, openrouter_api_key, skills_path):
         # Choose any OpenRouter-supported model; adjust as needed
         # See https://openrouter.ai/models for options
         model = OpenAIChatModel(
             "anthropic/claude-3.5-sonnet",
-            provider=OpenAIProvider(api_key=openrouter_api_key, base_url="https://openrouter.ai/api/v1"),
+            provider=OpenAIProvider(
+                api_key=openrouter_api_key,
+                base_url="https://openrouter.ai/api/v1",
+                # Same timeouts and User-Agent as pydantic-ai's default client
+                http_client=PromptCachingClient(
+                    timeout=httpx.Timeout(timeout=600, connect=5),
+                    headers={"User-Agent": get_user_agent()},
+                ),
+            ),
         )
 
         # Build the rest of the prompt using locate_skills
         skills = locate_skills(skills_path)
-        skills_list = "\n".join([f"- Name: {skill.name} | Description: {skill.description}" for skill in skills])
-        full_prompt = f"{BASE_PROMPT}{skills_list}\n"
+
+        # Index skills by name once so tool calls are a dict lookup
+        self._state = SkillState.from_skills(skills)
+
+        skills_list = "\n".join(f"- Name: {skill.name} | Description: {skill.description}" for skill in skills)
+        full_prompt = "".join((BASE_PROMPT, skills_list, "\n"))
 
         self._prompt = full_prompt
 
@@ -47,79 +231,11 @@ class ProgressiveDisclosureAgent:
         agent = Agent(
             instructions=full_prompt,
             model=model,
+            deps_type=SkillState,
+            tools=[list_skill_files, load_file_content],
             toolsets=[server],
         )
 
-        @agent.tool
-        def list_skill_files(ctx: RunContext[int], skill_name: str) -> str:
-            """
-            List all files in the folder for the skill with the given name.
-
-            Args:
-                ctx: RunContext (unused here, but required by the tool interface)
-                skill_name: The human-readable name field from the skill's frontmatter
-
-            Returns:
-                A newline-separated list of file paths contained in the skill's folder,
-                or a helpful message if the skill is not found or fails to load.
-            """
-            # Prefer exact match on name, then fallback to case-insensitive match
-            target = None
-            for s in skills:
-                if s.name == skill_name:
-                    target = s
-                    break
-            if target is None:
-                lowered = skill_name.lower().strip()
-                for s in skills:
-                    if s.name.lower().strip() == lowered:
-                        target = s
-                        break
-
-            if target is None:
-                available = ", ".join(sorted({s.name for s in skills}))
-                return f"Skill '{skill_name}' not found. Available skills: {available}"
-
-            try:
-                content = get_skill_content(target.skill_path)
-                # Include SKILL.md explicitly along with other files discovered recursively
-                all_files = [str(target.skill_path / "SKILL.md")] + content.other_files
-                return "\n".join(all_files)
-            except Exception as e:
-                return f"Failed to list files for '{skill_name}': {e}"
-
-        @agent.tool
-        def load_file_content(ctx: RunContext[int], file_path: str) -> str:
-            """
-            Load and return the content of the file at the given path.
-
-            Args:
-                ctx: RunContext (unused by this tool)
-                file_path: Absolute or relative path to a file
-
-            Returns:
-                The textual content of the file, or an error message if the file
-                doesn't exist, isn't a file, is too large, or can't be decoded.
-            """
-            try:
-                p = Path(file_path)
-                if not p.exists():
-                    return f"File not found: {file_path}"
-                if not p.is_file():
-                    return f"Path is not a file: {file_path}"
-                # Guard against accidentally loading very large files
-                try:
-                    size = p.stat().st_size
-                    if size > 5 * 1024 * 1024:  # 5 MB limit
-                        return f"File is too large to display ({size} bytes): {file_path}"
-                except Exception as e:
-                    # If stat fails, continue and try reading
-                    return f"Failed to call stat() on file '{file_path}': {e}"
-                # Read as text; replace undecodable bytes to avoid exceptions
-                return p.read_text(encoding="utf-8", errors="replace")
-            except Exception as e:
-                return f"Failed to read file '{file_path}': {e}"
-
         self._agent = agent
 
     @property
@@ -128,4 +244,4 @@ class ProgressiveDisclosureAgent:
 
     async def run(self):
         async with self._agent:
-            await self._agent.to_cli()
+            await self._agent.to_cli(deps=self._state)
@@ -1,19 +1,6 @@
 import asyncio
 import logging
 import os
-from dotenv import load_dotenv
-
-from agent import ProgressiveDisclosureAgent
-
-# Load environment variables from a .env file (if present) into os.environ
-load_dotenv()
-
-# Configure OpenRouter via OpenAI-compatible settings
-OPENROUTER_API_KEY = os.environ.get("OPENROUTER_API_KEY")
-if not OPENROUTER_API_KEY:
-    raise RuntimeError(
-        "OPENROUTER_API_KEY is not set. Please export your OpenRouter API key to the environment."
-    )
 
 logger = logging.getLogger(__name__)
 # configure logging
@@ -23,7 +10,23 @@ logging.basicConfig(
 )
 
 async def main():
-    agent = ProgressiveDisclosureAgent(OPENROUTER_API_KEY, "./skills")
+    # Heavy imports (dotenv, pydantic_ai and the OpenAI SDK via agent) are deferred
+    # until the assistant actually starts, keeping interpreter startup fast
+    from dotenv import load_dotenv
+
+    # Load environment variables from a .env file (if present) into os.environ
+    load_dotenv()
+
+    # Configure OpenRouter via OpenAI-compatible settings
+    openrouter_api_key = os.environ.get("OPENROUTER_API_KEY")
+    if not openrouter_api_key:
+        raise RuntimeError(
+            "OPENROUTER_API_KEY is not set. Please export your OpenRouter API key to the environment."
+        )
+
+    from agent import ProgressiveDisclosureAgent
+
+    agent = ProgressiveDisclosureAgent(openrouter_api_key, "./skills")
     logger.info(f"Built agent prompt:")
     logger.info(agent.prompt)
     await agent.run()
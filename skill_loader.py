@@ -10,20 +10,56 @@ Architecture:
 - Skills may include resources and REFERENCE.md files
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
-import yaml
-import re
+from typing import AnyStr, Dict, List, Optional, Tuple
+import os
+import pickle
+import stat
+import threading
+import warnings
 
 
+# Persistent cache of parsed SKILL.md headers, so unchanged skills are not
+# re-read and re-parsed on every process start.
+# Maps (skill_md_path, st_mtime_ns, st_size) -> (name, description)
+CACHE_PATH = Path.home() / ".cache" / "pda" / "skills.pkl"
+
+# Bump whenever the parsing or validation rules change, so entries written by an
+# older build are discarded instead of trusted
+CACHE_VERSION = 1
+
+CacheKey = Tuple[str, int, int]
+
+# locate_skills only needs the frontmatter, so it reads this many bytes of each
+# SKILL.md and falls back to the whole file only if the frontmatter is longer
+FRONTMATTER_READ_SIZE = 8192
+
+# (yaml module, loader class), set by _import_yaml()
+_yaml = None
+
+# In-process LRU of parsed frontmatter blocks, keyed by their UTF-8 bytes.
+# locate_skills (which may run on several threads), get_skill_content and
+# extract_yaml_frontmatter all share it
+FRONTMATTER_CACHE_SIZE = 256
+_frontmatter_cache: "OrderedDict[bytes, object]" = OrderedDict()
+_frontmatter_cache_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class SkillMetadata:
     """Represents the metadata/header of a skill."""
 
-    def __init__(self, skill_path: Path, name: str, description: str):
-        self.skill_path = skill_path
-        self.skill_id = skill_path.name
-        self.name = name
-        self.description = description
+    skill_path: Path
+    name: str
+    description: str
+
+    @property
+    def skill_id(self) -> str:
+        """The skill's directory name."""
+        return self.skill_path.name
 
     def to_dict(self) -> Dict[str, str]:
         """Convert metadata to dictionary format."""
@@ -38,28 +74,120 @@ class SkillMetadata:
         return f"SkillMetadata(skill_id='{self.skill_id}', name='{self.name}')"
 
 
+@dataclass(slots=True, frozen=True)
 class SkillContent:
     """Represents the full content of a skill."""
 
-    def __init__(
-        self,
-        metadata: SkillMetadata,
-        skill_md_content: str,
-        other_files: List[str],
-    ):
-        self.metadata = metadata
-        self.skill_md_content = skill_md_content
-        self.other_files = other_files
+    metadata: SkillMetadata
+    skill_md_content: str
+    other_files: Tuple[str, ...]
 
     def to_dict(self) -> Dict:
         """Convert skill content to dictionary format."""
         return {
             'metadata': self.metadata.to_dict(),
             'skill_md': self.skill_md_content,
-            'other_files': self.other_files,
+            'other_files': list(self.other_files),
         }
 
 
+def _import_yaml():
+    """
+    Import PyYAML on first use.
+
+    locate_skills serves unchanged skills from the disk cache without parsing any
+    YAML, so deferring the import keeps it off the startup path in that case.
+
+    Returns:
+        Tuple of (yaml_module, loader_class), preferring the libyaml CSafeLoader
+    """
+    global _yaml
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as loader
+        _yaml = (yaml, loader)
+    return _yaml
+
+
+def _split_frontmatter(content: AnyStr) -> Optional[Tuple[int, int, int]]:
+    """
+    Locate the frontmatter block at the start of a document.
+
+    Works on both str and bytes; only the frontmatter span is scanned.
+
+    Args:
+        content: The document, or its leading part
+
+    Returns:
+        Tuple of (frontmatter_start, frontmatter_end, remaining_start) offsets,
+        or None if the document does not open with a complete '---' block
+    """
+    if isinstance(content, bytes):
+        delimiter, newline = b'---', b'\n'
+    else:
+        delimiter, newline = '---', '\n'
+    closing = newline + delimiter
+
+    # Frontmatter must open the document with a '---' line
+    if not content.startswith(delimiter):
+        return None
+
+    start = content.find(newline, 3)
+    if start == -1 or content[3:start].strip():
+        return None
+
+    # Find the closing '---' line
+    end = content.find(closing, start)
+    while end != -1:
+        line_end = content.find(newline, end + 4)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[end + 4:line_end].strip():
+            break
+        end = content.find(closing, end + 1)
+
+    if end == -1:
+        return None
+
+    return start + 1, end, line_end + 1
+
+
+def _load_frontmatter(frontmatter_bytes: bytes) -> Optional[Dict]:
+    """
+    Parse a frontmatter block, reusing the result for previously seen blocks.
+
+    The cache is keyed on the frontmatter text itself (not the whole document), so
+    entries stay small and a hit can never return another document's metadata.
+
+    Args:
+        frontmatter_bytes: The UTF-8 encoded YAML between the '---' delimiters
+
+    Returns:
+        The parsed YAML, or None if it is empty or invalid; dicts are returned as
+        copies so callers may modify them
+    """
+    with _frontmatter_cache_lock:
+        frontmatter = _frontmatter_cache.get(frontmatter_bytes)
+        if frontmatter is not None:
+            _frontmatter_cache.move_to_end(frontmatter_bytes)
+
+    if frontmatter is None:
+        yaml, loader = _import_yaml()
+        try:
+            frontmatter = yaml.load(frontmatter_bytes, Loader=loader)
+        except yaml.YAMLError:
+            return None
+        with _frontmatter_cache_lock:
+            _frontmatter_cache[frontmatter_bytes] = frontmatter
+            if len(_frontmatter_cache) > FRONTMATTER_CACHE_SIZE:
+                _frontmatter_cache.popitem(last=False)
+
+    return dict(frontmatter) if isinstance(frontmatter, dict) else frontmatter
+
+
 def extract_yaml_frontmatter(content: str) -> tuple[Optional[Dict], str]:
     """
     Extract YAML frontmatter from markdown content.
@@ -71,32 +199,57 @@ def extract_yaml_frontmatter(content: str) -> tuple[Optional[Dict], str]:
         Tuple of (frontmatter_dict, remaining_content)
         Returns (None, content) if no valid frontmatter found
     """
-    # Match YAML frontmatter pattern: --- at start, content, --- at end
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
+    span = _split_frontmatter(content)
+    if span is None:
         return None, content
 
-    try:
-        frontmatter_str = match.group(1)
-        remaining_content = match.group(2)
-        frontmatter = yaml.safe_load(frontmatter_str)
-        return frontmatter, remaining_content
-    except yaml.YAMLError:
+    # Cache keys are always bytes; mixing str keys would compare str with bytes
+    frontmatter = _load_frontmatter(content[span[0]:span[1]].encode('utf-8', errors='surrogatepass'))
+    if frontmatter is None:
         return None, content
 
+    return frontmatter, content[span[2]:]
+
+
+def _read_frontmatter(head: bytes) -> Optional[Dict]:
+    """
+    Parse YAML frontmatter straight from the raw bytes of a SKILL.md.
+
+    Only the frontmatter span is handed to YAML (which decodes UTF-8 itself), so
+    the rest of the file is never decoded.
+
+    Args:
+        head: The leading bytes of the file
+
+    Returns:
+        The parsed frontmatter, or None if no valid frontmatter found
+    """
+    span = _split_frontmatter(head)
+    if span is None:
+        return None
+
+    return _load_frontmatter(head[span[0]:span[1]])
+
 
 def is_valid_skill_directory(path: Path) -> bool:
     """
     Check if a directory contains a valid skill (has SKILL.md with required metadata).
 
+    Deprecated: locate_skills() validates and parses SKILL.md in a single pass and no
+    longer uses this function. It is kept for external callers.
+
     Args:
         path: Path to the directory to check
 
     Returns:
         True if the directory contains a valid skill
     """
+    warnings.warn(
+        "is_valid_skill_directory() is deprecated; use locate_skills() instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
     if not path.is_dir():
         return False
 
@@ -117,12 +270,100 @@ def is_valid_skill_directory(path: Path) -> bool:
         return False
 
 
+def _load_cache() -> Dict[CacheKey, Tuple[str, str]]:
+    """
+    Load the skill metadata cache from disk.
+
+    Returns:
+        The cached entries, or an empty dict if the cache is missing, unreadable or
+        was written with a different CACHE_VERSION
+    """
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        return {}
+
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    entries = data.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache: Dict[CacheKey, Tuple[str, str]]) -> None:
+    """
+    Write the skill metadata cache to disk.
+
+    The file is written to a temporary path and then renamed into place so that
+    concurrent processes never observe a partially written cache. Failures are
+    ignored, since the cache is only an optimization.
+
+    Args:
+        cache: The entries to persist
+    """
+    tmp_path = CACHE_PATH.with_name(f"{CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'entries': cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CACHE_PATH)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_skill_header(skill_dir: str) -> Optional[Tuple[str, str]]:
+    """
+    Read the name and description of the skill in a directory.
+
+    Args:
+        skill_dir: Path to the candidate skill directory
+
+    Returns:
+        Tuple of (name, description), or None if the directory does not contain
+        a valid skill
+    """
+    skill_md = os.path.join(skill_dir, "SKILL.md")
+
+    # Read and parse SKILL.md once, skipping it unless it has the required fields
+    try:
+        with open(skill_md, 'rb') as f:
+            head = f.read(FRONTMATTER_READ_SIZE)
+            frontmatter = _read_frontmatter(head)
+            if frontmatter is None and len(head) == FRONTMATTER_READ_SIZE:
+                head += f.read()
+                frontmatter = _read_frontmatter(head)
+    except Exception as e:
+        # Skip skills with read errors
+        print(f"Warning: Could not load skill from {Path(skill_dir)}: {e}")
+        return None
+
+    if (
+        not isinstance(frontmatter, dict)
+        or 'name' not in frontmatter
+        or 'description' not in frontmatter
+    ):
+        return None
+
+    name, description = frontmatter['name'], frontmatter['description']
+    if not isinstance(name, str) or not isinstance(description, str):
+        print(f"Warning: Skipping skill in {Path(skill_dir)}: name and description must be strings")
+        return None
+
+    return name, description
+
+
 def locate_skills(root_folder: str | Path) -> List[SkillMetadata]:
     """
     Locate all valid skills in a given folder and return their metadata headers.
 
     This function scans the root folder for subdirectories containing SKILL.md files
-    with valid YAML frontmatter (name and description fields).
+    with valid YAML frontmatter (name and description fields). Parsed headers are
+    cached on disk (see CACHE_PATH) keyed by each SKILL.md's path, mtime and size,
+    so unchanged skills are not re-read on subsequent calls. Uncached SKILL.md files
+    are read on a thread pool.
 
     Args:
         root_folder: Path to the folder to search for skills
@@ -135,45 +376,86 @@ def locate_skills(root_folder: str | Path) -> List[SkillMetadata]:
         >>> for skill in skills:
         ...     print(f"{skill.name}: {skill.description}")
     """
-    root_path = Path(root_folder)
-
-    if not root_path.exists():
-        raise FileNotFoundError(f"Root folder not found: {root_folder}")
-
-    if not root_path.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {root_folder}")
+    try:
+        root_iter = os.scandir(root_folder)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Root folder not found: {root_folder}") from None
+    except NotADirectoryError:
+        raise NotADirectoryError(f"Path is not a directory: {root_folder}") from None
 
     skills = []
-
-    # Search for all directories in root folder
-    for item in root_path.iterdir():
-        if not item.is_dir():
-            continue
-
-        if not is_valid_skill_directory(item):
-            continue
-
-        # Read and parse SKILL.md
-        skill_md = item / "SKILL.md"
+    cache = _load_cache()
+    seen: Dict[CacheKey, Tuple[str, str]] = {}
+    cache_dirty = False
+
+    # Search for all directories in root folder; DirEntry.is_dir() is answered from
+    # the directory listing itself, so plain subdirectories need no extra stat
+    with root_iter:
+        skill_dirs = [entry.path for entry in root_iter if entry.is_dir()]
+
+    # Stat each SKILL.md on this thread and serve unchanged ones from the disk cache
+    candidates = []
+    for skill_dir in skill_dirs:
+        skill_md = os.path.join(skill_dir, "SKILL.md")
         try:
-            content = skill_md.read_text(encoding='utf-8')
-            frontmatter, _ = extract_yaml_frontmatter(content)
-
-            if frontmatter:
-                metadata = SkillMetadata(
-                    skill_path=item,
-                    name=frontmatter['name'],
-                    description=frontmatter['description']
-                )
-                skills.append(metadata)
-        except Exception as e:
-            # Skip skills with read errors
-            print(f"Warning: Could not load skill from {item}: {e}")
+            st = os.stat(skill_md)
+        except OSError:
             continue
+        key = (os.path.abspath(skill_md), st.st_mtime_ns, st.st_size)
+        header = cache.get(key)
+        # Treat anything but a (str, str) pair as a miss, e.g. a hand-edited cache
+        if not (
+            isinstance(header, tuple)
+            and len(header) == 2
+            and all(isinstance(value, str) for value in header)
+        ):
+            header = None
+        candidates.append((skill_dir, key, header))
+
+    # Read the remaining SKILL.md files concurrently so their I/O latency overlaps
+    misses = [(skill_dir, key) for skill_dir, key, header in candidates if header is None]
+    parsed = {}
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(32, len(misses))) as executor:
+            headers = executor.map(_read_skill_header, [skill_dir for skill_dir, _ in misses])
+            parsed = {key: header for (_, key), header in zip(misses, headers)}
+
+    # Assemble results in directory order
+    for skill_dir, key, header in candidates:
+        if header is None:
+            header = parsed[key]
+            if header is None:
+                continue
+            cache_dirty = True
+
+        name, description = header
+        skills.append(SkillMetadata(skill_path=Path(skill_dir), name=name, description=description))
+        seen[key] = header
+
+    # Drop entries for skills in this folder that changed, became invalid or were
+    # deleted; entries belonging to other folders are kept
+    abs_root = os.path.abspath(root_folder)
+    stale = [
+        k for k in cache
+        if k not in seen and os.path.dirname(os.path.dirname(k[0])) == abs_root
+    ]
+
+    if cache_dirty or stale:
+        for k in stale:
+            del cache[k]
+        cache.update(seen)
+        _save_cache(cache)
 
     return skills
 
 
+# Per-process cache of get_skill_content() results, in insertion order
+# Maps (skill_path, dir_mtime_ns, skill_md_mtime_ns, skill_md_size) -> SkillContent
+CONTENT_CACHE_SIZE = 128
+_content_cache: Dict[Tuple[str, int, int, int], SkillContent] = {}
+_content_cache_lock = threading.Lock()
+
+
 def get_skill_content(skill_path: str | Path) -> SkillContent:
     """
     Retrieve the complete content of a skill for LLM consumption.
@@ -183,6 +465,10 @@ def get_skill_content(skill_path: str | Path) -> SkillContent:
     - Full SKILL.md content
     - List of resource files
 
+    Results are cached per process and reused while the skill directory's and
+    SKILL.md's modification times are unchanged. Changes confined to nested
+    subdirectories do not invalidate the cache.
+
     Args:
         skill_path: Path to the skill directory
 
@@ -200,23 +486,42 @@ def get_skill_content(skill_path: str | Path) -> SkillContent:
     """
     skill_path = Path(skill_path)
 
-    if not skill_path.exists():
-        raise FileNotFoundError(f"Skill directory not found: {skill_path}")
+    try:
+        dir_st = os.stat(skill_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill directory not found: {skill_path}") from None
 
-    if not skill_path.is_dir():
+    if not stat.S_ISDIR(dir_st.st_mode):
         raise NotADirectoryError(f"Path is not a directory: {skill_path}")
 
     skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        raise FileNotFoundError(f"SKILL.md not found in {skill_path}")
-
-    # Read SKILL.md
-    skill_md_content = skill_md.read_text(encoding='utf-8')
-    frontmatter, _ = extract_yaml_frontmatter(skill_md_content)
+    try:
+        md_st = os.stat(skill_md)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SKILL.md not found in {skill_path}") from None
+
+    # Adding or removing top-level files bumps the directory mtime, and editing
+    # SKILL.md changes its own mtime/size; either invalidates the cached entry
+    cache_key = (str(skill_path), dir_st.st_mtime_ns, md_st.st_mtime_ns, md_st.st_size)
+    with _content_cache_lock:
+        cached = _content_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Read SKILL.md as bytes and parse the frontmatter the same way locate_skills
+    # does, so the parse it already cached is reused
+    with open(skill_md, 'rb') as f:
+        data = f.read()
+    frontmatter = _read_frontmatter(data)
+    # Match read_text(): strict UTF-8 with universal newlines
+    skill_md_content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
     if not frontmatter or 'name' not in frontmatter or 'description' not in frontmatter:
         raise ValueError(f"SKILL.md in {skill_path} missing required frontmatter fields (name, description)")
 
+    if not isinstance(frontmatter['name'], str) or not isinstance(frontmatter['description'], str):
+        raise ValueError(f"SKILL.md in {skill_path} has non-string frontmatter fields (name, description)")
+
     # Create metadata
     metadata = SkillMetadata(
         skill_path=skill_path,
@@ -224,17 +529,30 @@ def get_skill_content(skill_path: str | Path) -> SkillContent:
         description=frontmatter['description']
     )
 
-    # Collect other files in the skill directory (recursively), excluding SKILL.md
-    other_files = sorted(
-        str(p)
-        for p in skill_path.rglob('*')
-        if p.is_file() and p.name != 'SKILL.md'
-    )
-
-    return SkillContent(
+    # Collect other files in the skill directory (recursively), excluding its SKILL.md
+    # os.walk classifies entries from the directory listing, so no per-file stat is needed
+    root_dir = str(skill_path)
+    other_files = []
+    for dirpath, _, filenames in os.walk(root_dir):
+        for name in filenames:
+            if name == 'SKILL.md' and dirpath == root_dir:
+                continue
+            other_files.append(os.path.join(dirpath, name))
+    other_files.sort()
+
+    content = SkillContent(
         metadata=metadata,
         skill_md_content=skill_md_content,
-        other_files=other_files,
+        other_files=tuple(other_files),
     )
 
+    # Evict the oldest entry once the cache is full; tools may call this from
+    # several threads at once
+    with _content_cache_lock:
+        if cache_key not in _content_cache and len(_content_cache) >= CONTENT_CACHE_SIZE:
+            del _content_cache[next(iter(_content_cache))]
+        _content_cache[cache_key] = content
+
+    return content
+
 